@@ -4,21 +4,12 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.components.bluetooth import async_ble_device_from_address
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.components.bluetooth import async_address_present
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
-
-from .const import (
-    CONF_ADDRESS,
-    CONF_BUTTON_UUID,
-    CONF_FIRMWARE_VERSION,
-    CONF_NAME,
-    CONF_SERIAL_NUMBER,
-    DOMAIN,
-    MANUFACTURER,
-)
+
+from .const import CONF_ADDRESS
 from .coordinator import Flic2Coordinator, FlicConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,9 +21,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: FlicConfigEntry) -> bool
     """Set up Flic 2 BLE from a config entry."""
     address = entry.data[CONF_ADDRESS]
 
-    # Verify device is discoverable
-    ble_device = async_ble_device_from_address(hass, address, connectable=True)
-    if not ble_device:
+    # Verify device is discoverable; the coordinator resolves the BLEDevice
+    # itself when connecting, so only check presence here
+    if not async_address_present(hass, address, connectable=True):
         _LOGGER.warning(
             "Device %s not found during setup, will retry when available", address
         )
@@ -42,18 +33,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: FlicConfigEntry) -> bool
     coordinator = Flic2Coordinator(hass, entry)
     entry.runtime_data = coordinator
 
-    # Register device in device registry
-    device_registry = dr.async_get(hass)
-    device_registry.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        connections={(dr.CONNECTION_BLUETOOTH, address)},
-        identifiers={(DOMAIN, entry.data[CONF_BUTTON_UUID])},
-        manufacturer=MANUFACTURER,
-        name=entry.data.get(CONF_NAME) or entry.title,
-        model="Flic 2",
-        serial_number=entry.data.get(CONF_SERIAL_NUMBER),
-        sw_version=str(entry.data.get(CONF_FIRMWARE_VERSION, "")),
-    )
+    # Register cleanup on unload before anything starts, so a failed setup
+    # still stops the coordinator
+    entry.async_on_unload(coordinator.async_stop)
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -61,8 +43,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: FlicConfigEntry) -> bool
     # Start coordinator
     await coordinator.async_start()
 
-    # Register cleanup on unload
-    entry.async_on_unload(coordinator.async_stop)
+    # Entries are not unloaded when Home Assistant stops, so disconnect then too
+    async def _async_stop(event: Event) -> None:
+        """Disconnect from the button when Home Assistant stops."""
+        await coordinator.async_stop()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    )
 
     return True
 
@@ -31,6 +31,26 @@ from .flic2 import Flic2Client, PairingCredentials, PairingError, TimeoutError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Service UUIDs that identify a Flic 2 button, normalized to lowercase
+_FLIC2_SERVICE_UUIDS = frozenset({FLIC2_SERVICE_UUID.lower()})
+
+
+def _default_name(address: str) -> str:
+    """Return a fallback name for a button that does not advertise one."""
+    return f"Flic 2 {address[-5:]}"
+
+
+def _credentials_to_entry_data(credentials: PairingCredentials) -> dict[str, Any]:
+    """Return config entry data for pairing credentials."""
+    return {
+        CONF_NAME: credentials.name,
+        CONF_PAIRING_ID: credentials.pairing_id.hex(),
+        CONF_PAIRING_KEY: credentials.pairing_key.hex(),
+        CONF_BUTTON_UUID: credentials.button_uuid,
+        CONF_SERIAL_NUMBER: credentials.serial_number,
+        CONF_FIRMWARE_VERSION: credentials.firmware_version,
+    }
+
 
 class FlicBleConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Flic 2 BLE."""
@@ -54,7 +74,7 @@ class FlicBleConfigFlow(ConfigFlow, domain=DOMAIN):
 
         self._discovery_info = discovery_info
         self._address = discovery_info.address
-        self._name = discovery_info.name or f"Flic 2 {discovery_info.address[-5:]}"
+        self._name = discovery_info.name or _default_name(discovery_info.address)
 
         self.context["title_placeholders"] = {"name": self._name}
 
@@ -72,29 +92,28 @@ class FlicBleConfigFlow(ConfigFlow, domain=DOMAIN):
             discovery = self._discovered_devices[address]
             self._discovery_info = discovery
             self._address = address
-            self._name = discovery.name or f"Flic 2 {address[-5:]}"
+            self._name = discovery.name or _default_name(address)
             self.context["title_placeholders"] = {"name": self._name}
 
             return await self.async_step_confirm_pair()
 
         # Discover available Flic 2 devices
         current_addresses = self._async_current_ids(include_ignore=False)
+        discovered_devices = self._discovered_devices
+        titles: dict[str, str] = {}
         for discovery_info in async_discovered_service_info(self.hass, connectable=True):
             address = discovery_info.address
-            if address in current_addresses or address in self._discovered_devices:
+            if address in current_addresses:
                 continue
-            # Check if this is a Flic 2 device by service UUID
-            service_uuids = [str(uuid).lower() for uuid in discovery_info.service_uuids]
-            if FLIC2_SERVICE_UUID.lower() in service_uuids:
-                self._discovered_devices[address] = discovery_info
+            # Check if this is a Flic 2 device by service UUID. Bleak reports
+            # service UUIDs as normalized lowercase strings.
+            if not _FLIC2_SERVICE_UUIDS.isdisjoint(discovery_info.service_uuids):
+                discovered_devices[address] = discovery_info
+                titles[address] = discovery_info.name or _default_name(address)
 
-        if not self._discovered_devices:
+        if not titles:
             return self.async_abort(reason="no_devices_found")
 
-        titles = {
-            address: info.name or f"Flic 2 {address[-5:]}"
-            for address, info in self._discovered_devices.items()
-        }
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema({vol.Required(CONF_ADDRESS): vol.In(titles)}),
@@ -165,12 +184,7 @@ class FlicBleConfigFlow(ConfigFlow, domain=DOMAIN):
             title=credentials.name or self._name or "Flic 2",
             data={
                 CONF_ADDRESS: self._address,
-                CONF_NAME: credentials.name,
-                CONF_PAIRING_ID: credentials.pairing_id.hex(),
-                CONF_PAIRING_KEY: credentials.pairing_key.hex(),
-                CONF_BUTTON_UUID: credentials.button_uuid,
-                CONF_SERIAL_NUMBER: credentials.serial_number,
-                CONF_FIRMWARE_VERSION: credentials.firmware_version,
+                **_credentials_to_entry_data(credentials),
             },
         )
 
@@ -179,7 +193,7 @@ class FlicBleConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle re-authentication when pairing is lost."""
         self._address = entry_data[CONF_ADDRESS]
-        self._name = entry_data.get(CONF_NAME) or f"Flic 2 {self._address[-5:]}"
+        self._name = entry_data.get(CONF_NAME) or _default_name(self._address)
         return await self.async_step_reauth_confirm()
 
     async def async_step_reauth_confirm(
@@ -193,14 +207,7 @@ class FlicBleConfigFlow(ConfigFlow, domain=DOMAIN):
                 credentials = await self._async_pair_button()
                 return self.async_update_reload_and_abort(
                     self._get_reauth_entry(),
-                    data_updates={
-                        CONF_NAME: credentials.name,
-                        CONF_PAIRING_ID: credentials.pairing_id.hex(),
-                        CONF_PAIRING_KEY: credentials.pairing_key.hex(),
-                        CONF_BUTTON_UUID: credentials.button_uuid,
-                        CONF_SERIAL_NUMBER: credentials.serial_number,
-                        CONF_FIRMWARE_VERSION: credentials.firmware_version,
-                    },
+                    data_updates=_credentials_to_entry_data(credentials),
                 )
             except TimeoutError:
                 _LOGGER.warning("Re-pairing timed out for %s", self._address)
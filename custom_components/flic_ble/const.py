@@ -23,6 +23,9 @@ EVENT_DOUBLE_PRESS: Final = "double_press"
 EVENT_HOLD: Final = "hold"
 EVENT_TYPES: Final[list[str]] = [EVENT_SINGLE_PRESS, EVENT_DOUBLE_PRESS, EVENT_HOLD]
 
+# Event that is fired when a button is pressed
+FLIC_BLE_EVENT: Final = f"{DOMAIN}_event"
+
 # Timeouts (seconds)
 CONNECTION_TIMEOUT: Final = 15
 PAIRING_TIMEOUT: Final = 30
@@ -30,6 +33,5 @@ QUICK_VERIFY_TIMEOUT: Final = 10
 RECONNECT_INTERVAL: Final = 30
 
 # Dispatcher signals
-SIGNAL_BUTTON_EVENT: Final = f"{DOMAIN}_button_event"
 SIGNAL_BATTERY_UPDATE: Final = f"{DOMAIN}_battery_update"
 SIGNAL_CONNECTION_CHANGED: Final = f"{DOMAIN}_connection_changed"
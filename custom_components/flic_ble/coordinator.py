@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+import random
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components import bluetooth
 from homeassistant.const import CONF_DEVICE_ID, CONF_TYPE
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
@@ -26,10 +27,10 @@ from .const import (
     EVENT_DOUBLE_PRESS,
     EVENT_HOLD,
     EVENT_SINGLE_PRESS,
+    FLIC_BLE_EVENT,
     QUICK_VERIFY_TIMEOUT,
     RECONNECT_INTERVAL,
     SIGNAL_BATTERY_UPDATE,
-    SIGNAL_BUTTON_EVENT,
     SIGNAL_CONNECTION_CHANGED,
 )
 from .flic2 import (
@@ -37,6 +38,7 @@ from .flic2 import (
     ButtonEventType,
     ConnectionState,
     Flic2Client,
+    NoPairingError,
     PairingCredentials,
     PairingError,
 )
@@ -49,6 +51,15 @@ _LOGGER = logging.getLogger(__name__)
 
 type FlicConfigEntry = ConfigEntry[Flic2Coordinator]
 
+# Map Flic2 ButtonEventType to our event types
+# Note: Only CLICK should map to single_press. SINGLE_CLICK (type 3) is sent
+# right before HOLD events as an internal state transition and should be ignored.
+_EVENT_TYPE_MAP: Final[dict[ButtonEventType, str]] = {
+    ButtonEventType.CLICK: EVENT_SINGLE_PRESS,
+    ButtonEventType.DOUBLE_CLICK: EVENT_DOUBLE_PRESS,
+    ButtonEventType.HOLD: EVENT_HOLD,
+}
+
 
 class Flic2Coordinator:
     """Coordinator to manage connection and events for a Flic 2 button."""
@@ -69,6 +80,10 @@ class Flic2Coordinator:
         self.serial_number: str = config_entry.data.get(CONF_SERIAL_NUMBER, "")
         self.firmware_version: int = config_entry.data.get(CONF_FIRMWARE_VERSION, 0)
 
+        # Dispatcher signals for this device
+        self.signal_battery_update = f"{SIGNAL_BATTERY_UPDATE}_{self.address}"
+        self.signal_connection_changed = f"{SIGNAL_CONNECTION_CHANGED}_{self.address}"
+
         # Restore credentials from config entry
         self._credentials = self._restore_credentials()
 
@@ -79,6 +94,8 @@ class Flic2Coordinator:
         self._running = False
         self._reconnect_task: asyncio.Task[None] | None = None
         self._listen_task: asyncio.Task[None] | None = None
+        self._stop_event = asyncio.Event()
+        self._device_id: str | None = None
 
         # Set up callbacks
         self._client.on_button_event = self._handle_button_event
@@ -86,7 +103,7 @@ class Flic2Coordinator:
         self._client.on_connection_state_changed = self._handle_connection_change
 
         # Event callbacks for entities
-        self._event_callbacks: list[callback] = []
+        self._event_callbacks: set[callback] = set()
 
     def _restore_credentials(self) -> PairingCredentials:
         """Restore pairing credentials from config entry data."""
@@ -115,6 +132,7 @@ class Flic2Coordinator:
         """Start the coordinator."""
         _LOGGER.debug("Starting Flic 2 coordinator for %s", self.address)
         self._running = True
+        self._stop_event.clear()
 
         # Register for Bluetooth unavailability tracking
         self.config_entry.async_on_unload(
@@ -126,6 +144,15 @@ class Flic2Coordinator:
             )
         )
 
+        # Track device registry removals to invalidate the cached device id
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._handle_device_registry_updated,
+                event_filter=self._device_registry_event_filter,
+            )
+        )
+
         # Start initial connection
         await self._async_connect()
 
@@ -133,23 +160,19 @@ class Flic2Coordinator:
         """Stop the coordinator."""
         _LOGGER.debug("Stopping Flic 2 coordinator for %s", self.address)
         self._running = False
-
-        # Cancel reconnect task
-        if self._reconnect_task and not self._reconnect_task.done():
-            self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                pass
-
-        # Cancel listen task
-        if self._listen_task and not self._listen_task.done():
+        self._stop_event.set()
+
+        # Cancel reconnect and listen tasks and wait for both together
+        tasks = [
+            task
+            for task in (self._reconnect_task, self._listen_task)
+            if task and not task.done()
+        ]
+        if self._listen_task in tasks:
             self._client.stop()
-            self._listen_task.cancel()
-            try:
-                await self._listen_task
-            except asyncio.CancelledError:
-                pass
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         # Disconnect client
         await self._client.disconnect()
@@ -157,7 +180,7 @@ class Flic2Coordinator:
 
     async def _async_connect(self) -> None:
         """Connect to the Flic 2 button."""
-        if not self._running:
+        if not self._running or self.hass.is_stopping:
             return
 
         ble_device = bluetooth.async_ble_device_from_address(
@@ -190,18 +213,19 @@ class Flic2Coordinator:
                 f"flic_ble_listen_{self.address}",
             )
 
-        except PairingError as err:
-            error_msg = str(err)
-            _LOGGER.warning("Pairing error for %s: %s", self.address, error_msg)
+        except NoPairingError as err:
+            # The button doesn't have our pairing, trigger re-auth flow
+            _LOGGER.warning("Pairing error for %s: %s", self.address, err)
             self._available = False
             await self._client.disconnect()
+            raise ConfigEntryAuthFailed(
+                "Button pairing was lost. Please re-pair the device."
+            ) from err
 
-            # If the button doesn't have our pairing, trigger re-auth flow
-            if "no pairing exists" in error_msg.lower():
-                raise ConfigEntryAuthFailed(
-                    "Button pairing was lost. Please re-pair the device."
-                ) from err
-
+        except PairingError as err:
+            _LOGGER.warning("Pairing error for %s: %s", self.address, err)
+            self._available = False
+            await self._client.disconnect()
             self._schedule_reconnect()
 
         except Exception as err:
@@ -242,8 +266,11 @@ class Flic2Coordinator:
 
     async def _async_reconnect_after_delay(self) -> None:
         """Wait and then attempt reconnection."""
-        await asyncio.sleep(RECONNECT_INTERVAL)
-        if self._running:
+        # Jitter the delay so buttons that dropped together don't retry in lockstep
+        delay = RECONNECT_INTERVAL * random.uniform(0.5, 1.5)
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), delay)
+        except TimeoutError:
             await self._async_connect()
 
     @callback
@@ -259,52 +286,62 @@ class Flic2Coordinator:
         _LOGGER.debug("Button event from %s: %s", self.address, event)
 
         # Map button event type to our event type string
-        # Note: Only CLICK should map to single_press. SINGLE_CLICK (type 3) is sent
-        # right before HOLD events as an internal state transition and should be ignored.
-        event_type_map = {
-            ButtonEventType.CLICK: EVENT_SINGLE_PRESS,
-            ButtonEventType.DOUBLE_CLICK: EVENT_DOUBLE_PRESS,
-            ButtonEventType.HOLD: EVENT_HOLD,
-        }
-
-        event_type = event_type_map.get(event.event_type)
+        event_type = _EVENT_TYPE_MAP.get(event.event_type)
         if not event_type:
             _LOGGER.debug("Ignoring unmapped event type: %s", event.event_type)
             return  # Ignore events we don't map (e.g., UP, DOWN)
 
         _LOGGER.debug("Mapped event %s -> %s", event.event_type, event_type)
 
-        # Dispatch event to entities
-        async_dispatcher_send(
-            self.hass,
-            f"{SIGNAL_BUTTON_EVENT}_{self.address}",
-            event,
-        )
-
         # Fire event on event bus for device triggers
-        device_registry = dr.async_get(self.hass)
-        device = device_registry.async_get_device(
-            identifiers={(DOMAIN, self.button_uuid)}
-        )
-        if device:
-            _LOGGER.info("Firing %s event for device %s", event_type, device.id)
+        device_id = self._async_get_device_id()
+        if device_id:
+            _LOGGER.info("Firing %s event for device %s", event_type, device_id)
             self.hass.bus.async_fire(
-                f"{DOMAIN}_event",
+                FLIC_BLE_EVENT,
                 {
-                    CONF_DEVICE_ID: device.id,
+                    CONF_DEVICE_ID: device_id,
                     CONF_TYPE: event_type,
                 },
             )
         else:
             _LOGGER.warning("Device not found for button_uuid: %s", self.button_uuid)
 
-        # Also notify direct subscribers
-        for cb in self._event_callbacks:
+        # Notify direct subscribers (entities)
+        for cb in tuple(self._event_callbacks):
             try:
                 cb(event)
             except Exception:
                 _LOGGER.exception("Error in event callback")
 
+    @callback
+    def _async_get_device_id(self) -> str | None:
+        """Return the device registry id for this button, caching the lookup."""
+        if self._device_id is None:
+            device = dr.async_get(self.hass).async_get_device(
+                identifiers={(DOMAIN, self.button_uuid)}
+            )
+            if device:
+                self._device_id = device.id
+        return self._device_id
+
+    @callback
+    def _device_registry_event_filter(
+        self, event_data: dr.EventDeviceRegistryUpdatedData
+    ) -> bool:
+        """Only pass removals of this button's cached device."""
+        return (
+            event_data["action"] == "remove"
+            and event_data["device_id"] == self._device_id
+        )
+
+    @callback
+    def _handle_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Forget the cached device id when the device is removed."""
+        self._device_id = None
+
     def _handle_battery_update(self, level: int) -> None:
         """Handle battery level update from client."""
         _LOGGER.debug("Battery level for %s: %d%%", self.address, level)
@@ -312,7 +349,7 @@ class Flic2Coordinator:
 
         async_dispatcher_send(
             self.hass,
-            f"{SIGNAL_BATTERY_UPDATE}_{self.address}",
+            self.signal_battery_update,
             level,
         )
 
@@ -321,12 +358,12 @@ class Flic2Coordinator:
         _LOGGER.debug("Connection state for %s: %s", self.address, state.name)
 
         was_available = self._available
-        self._available = state == ConnectionState.READY
+        self._available = state is ConnectionState.READY
 
         if was_available != self._available:
             async_dispatcher_send(
                 self.hass,
-                f"{SIGNAL_CONNECTION_CHANGED}_{self.address}",
+                self.signal_connection_changed,
                 self._available,
             )
 
@@ -335,11 +372,11 @@ class Flic2Coordinator:
         self, callback_func: callback
     ) -> callback:
         """Subscribe to button events. Returns unsubscribe callable."""
-        self._event_callbacks.append(callback_func)
+        self._event_callbacks.add(callback_func)
 
         @callback
         def unsubscribe() -> None:
-            self._event_callbacks.remove(callback_func)
+            self._event_callbacks.discard(callback_func)
 
         return unsubscribe
 
@@ -19,10 +19,7 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, EVENT_TYPES
-
-# Event that is fired when a button is pressed
-FLIC_BLE_EVENT = f"{DOMAIN}_event"
+from .const import DOMAIN, EVENT_TYPES, FLIC_BLE_EVENT
 
 TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     {vol.Required(CONF_TYPE): vol.In(EVENT_TYPES)}
@@ -44,6 +41,20 @@ async def async_get_triggers(
     ]
 
 
+def _event_trigger_config(device_id: str, trigger_type: str) -> ConfigType:
+    """Return a freshly validated event trigger config for a device trigger."""
+    return event_trigger.TRIGGER_SCHEMA(
+        {
+            event_trigger.CONF_PLATFORM: CONF_EVENT,
+            event_trigger.CONF_EVENT_TYPE: FLIC_BLE_EVENT,
+            event_trigger.CONF_EVENT_DATA: {
+                CONF_DEVICE_ID: device_id,
+                CONF_TYPE: trigger_type,
+            },
+        }
+    )
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -53,16 +64,7 @@ async def async_attach_trigger(
     """Attach a trigger."""
     return await event_trigger.async_attach_trigger(
         hass,
-        event_trigger.TRIGGER_SCHEMA(
-            {
-                event_trigger.CONF_PLATFORM: CONF_EVENT,
-                event_trigger.CONF_EVENT_TYPE: FLIC_BLE_EVENT,
-                event_trigger.CONF_EVENT_DATA: {
-                    CONF_DEVICE_ID: config[CONF_DEVICE_ID],
-                    CONF_TYPE: config[CONF_TYPE],
-                },
-            }
-        ),
+        _event_trigger_config(config[CONF_DEVICE_ID], config[CONF_TYPE]),
         action,
         trigger_info,
         platform_type="device",
@@ -21,6 +21,6 @@ async def async_get_config_entry_diagnostics(
     coordinator = entry.runtime_data
 
     return {
-        "entry_data": async_redact_data(dict(entry.data), TO_REDACT),
+        "entry_data": async_redact_data(entry.data, TO_REDACT),
         "coordinator": coordinator.get_diagnostics_data(),
     }
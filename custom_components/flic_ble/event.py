@@ -8,7 +8,6 @@ from homeassistant.components.event import (
     EventEntityDescription,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import (
@@ -16,7 +15,6 @@ from .const import (
     EVENT_HOLD,
     EVENT_SINGLE_PRESS,
     EVENT_TYPES,
-    SIGNAL_BUTTON_EVENT,
 )
 from .coordinator import Flic2Coordinator, FlicConfigEntry
 from .entity import Flic2Entity
@@ -63,21 +61,17 @@ class Flic2ButtonEvent(Flic2Entity, EventEntity):
         """Subscribe to button events when entity is added."""
         await super().async_added_to_hass()
 
-        # Subscribe to dispatcher events
+        # Subscribe directly to coordinator button events
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{SIGNAL_BUTTON_EVENT}_{self.coordinator.address}",
-                self._handle_button_event,
-            )
+            self.coordinator.async_subscribe_events(self._handle_button_event)
         )
 
     @callback
     def _handle_button_event(self, event: ButtonEvent) -> None:
         """Handle a button event from the coordinator."""
         # Map the event type
-        if event.event_type in EVENT_TYPE_MAP:
-            event_type = EVENT_TYPE_MAP[event.event_type]
+        event_type = EVENT_TYPE_MAP.get(event.event_type)
+        if event_type is not None:
             self._trigger_event(
                 event_type,
                 {
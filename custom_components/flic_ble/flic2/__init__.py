@@ -64,6 +64,7 @@ from .exceptions import (
     ConnectionError,
     PairingError,
     InvalidVerifierError,
+    NoPairingError,
     InvalidSignatureError,
     ProtocolError,
     TimeoutError,
@@ -98,6 +99,7 @@ __all__ = [
     "ConnectionError",
     "PairingError",
     "InvalidVerifierError",
+    "NoPairingError",
     "InvalidSignatureError",
     "ProtocolError",
     "TimeoutError",
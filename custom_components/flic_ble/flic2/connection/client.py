@@ -2,9 +2,10 @@
 
 import asyncio
 import logging
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, List
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
 
@@ -20,6 +21,8 @@ from ..const import (
     FLIC2_NOTIFY_UUID,
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_OPERATION_TIMEOUT,
+    MAX_QUEUED_PACKETS,
+    SIGNATURE_LENGTH,
 )
 from ..models import (
     ButtonEvent,
@@ -28,10 +31,12 @@ from ..models import (
     PairingCredentials,
     SessionState,
 )
+from ..crypto import ChaskeyLTS
 from ..protocol import PacketEncoder, PacketDecoder, PairingStateMachine, Opcode
 from ..exceptions import (
     ConnectionError,
     PairingError,
+    NoPairingError,
     NotPairedError,
     TimeoutError,
 )
@@ -41,6 +46,38 @@ from .scanner import Flic2Scanner
 _LOGGER = logging.getLogger(__name__)
 
 
+def _build_init_button_events_body() -> bytes:
+    """Build the InitButtonEventsLight opcode and payload."""
+    event_count = 0
+    boot_id = 0
+    auto_disconnect_time = 511  # Max value (disabled)
+    max_queued_packets = 31
+    max_queued_packets_age = 0xFFFFF
+    enable_hid = 0
+
+    # Pack bit fields
+    bitfield_val = (
+        auto_disconnect_time |
+        (max_queued_packets << 9) |
+        (max_queued_packets_age << 14) |
+        (enable_hid << 34)
+    )
+    bitfield_bytes = bitfield_val.to_bytes(5, 'little')
+
+    payload = (
+        event_count.to_bytes(4, 'little') +
+        boot_id.to_bytes(4, 'little') +
+        bitfield_bytes
+    )
+
+    # Opcode 0x17 (INIT_BUTTON_EVENTS)
+    return bytes([0x17]) + payload
+
+
+# All InitButtonEventsLight fields are fixed, so the body is built once
+_INIT_BUTTON_EVENTS_BODY = _build_init_button_events_body()
+
+
 class Flic2Client:
     """
     Main client for interacting with Flic 2 buttons.
@@ -67,6 +104,33 @@ class Flic2Client:
         await client.listen()
     """
 
+    __slots__ = (
+        "_bleak_client",
+        "_write_char",
+        "_device",
+        "_address",
+        "_credentials",
+        "_credentials_address",
+        "_session",
+        "_encoder",
+        "_decoder",
+        "_chaskey",
+        "_state_machine",
+        "_connection_state",
+        "_running",
+        "_stop_event",
+        "_response_event",
+        "_last_response",
+        "_packet_queue",
+        "_packet_task",
+        "_fragment_buffer",
+        "_expecting_fragments",
+        "_opcode_handlers",
+        "on_button_event",
+        "on_connection_state_changed",
+        "on_battery_level",
+    )
+
     def __init__(
         self,
         stored_credentials: Optional[PairingCredentials] = None,
@@ -78,27 +142,43 @@ class Flic2Client:
             stored_credentials: Optional stored credentials for quick verify
         """
         self._bleak_client: Optional[BleakClient] = None
+        self._write_char: Optional[BleakGATTCharacteristic] = None
         self._device: Optional[BLEDevice] = None
         self._address: Optional[str] = None
 
-        self._credentials = stored_credentials
+        self._credentials: Optional[PairingCredentials] = None
+        self._credentials_address: Optional[str] = None
+        self.set_credentials(stored_credentials)
         self._session = SessionState()
 
         self._encoder = PacketEncoder()
         self._decoder = PacketDecoder()
+        self._chaskey: Optional[ChaskeyLTS] = None
         self._state_machine: Optional[PairingStateMachine] = None
 
         self._connection_state = ConnectionState.DISCONNECTED
         self._running = False
+        self._stop_event = asyncio.Event()
 
         # Response handling
         self._response_event = asyncio.Event()
         self._last_response: Optional[bytes] = None
 
+        # Received packets, processed in order by a single worker task
+        self._packet_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=MAX_QUEUED_PACKETS)
+        self._packet_task: Optional[asyncio.Task] = None
+
         # Fragmentation
         self._fragment_buffer: bytes = b""
         self._expecting_fragments = False
 
+        # Handlers for packets received after pairing, keyed by opcode
+        self._opcode_handlers: Dict[int, Callable[[memoryview], None]] = {
+            Opcode.BUTTON_EVENT_SINGLE: self._handle_button_events,
+            Opcode.BUTTON_EVENT_NOTIFICATION: self._handle_button_events,
+            Opcode.PING_RESPONSE: self._handle_ping_response,
+        }
+
         # Callbacks
         self.on_button_event: Optional[Callable[[ButtonEvent], None]] = None
         self.on_connection_state_changed: Optional[Callable[[ConnectionState], None]] = None
@@ -112,7 +192,7 @@ class Flic2Client:
     @connection_state.setter
     def connection_state(self, state: ConnectionState):
         """Set connection state and notify."""
-        if self._connection_state != state:
+        if self._connection_state is not state:
             self._connection_state = state
             _LOGGER.debug(f"Connection state: {state.name}")
             if self.on_connection_state_changed:
@@ -129,19 +209,21 @@ class Flic2Client:
     @property
     def is_ready(self) -> bool:
         """Check if ready to receive events (paired/verified)."""
-        return self.connection_state == ConnectionState.READY
+        return self._connection_state is ConnectionState.READY
 
     def has_stored_credentials(self, address: Optional[str] = None) -> bool:
         """Check if we have stored credentials for the given address."""
         if not self._credentials:
             return False
         if address:
-            return self._credentials.address.upper() == address.upper()
+            return self._credentials_address == address.upper()
         return True
 
-    def set_credentials(self, credentials: PairingCredentials):
+    def set_credentials(self, credentials: Optional[PairingCredentials]):
         """Set stored credentials."""
         self._credentials = credentials
+        # Uppercased once here so address checks don't redo it
+        self._credentials_address = credentials.address.upper() if credentials else None
 
     def get_credentials(self) -> Optional[PairingCredentials]:
         """Get current credentials."""
@@ -208,12 +290,23 @@ class Flic2Client:
                     timeout=timeout,
                 )
 
-            # Subscribe to notifications
-            await self._bleak_client.start_notify(
-                FLIC2_NOTIFY_UUID,
-                self._on_notification,
+            # Resolve the write characteristic once for all sends
+            self._write_char = self._bleak_client.services.get_characteristic(
+                FLIC2_WRITE_UUID
             )
 
+            # Subscribe to notifications; the worker is started first so no
+            # early notification is dropped, and cancelled if subscribing fails
+            self._start_packet_worker()
+            try:
+                await self._bleak_client.start_notify(
+                    FLIC2_NOTIFY_UUID,
+                    self._on_notification,
+                )
+            except BaseException:
+                self._stop_packet_worker()
+                raise
+
             self.connection_state = ConnectionState.CONNECTED
             _LOGGER.info(f"Connected to {self._address}")
             return True
@@ -236,34 +329,62 @@ class Flic2Client:
             finally:
                 self._bleak_client = None
 
+        self._write_char = None
+        self._stop_packet_worker()
         self._session.reset()
         self.connection_state = ConnectionState.DISCONNECTED
         self._running = False
+        self._stop_event.set()
 
     def _on_disconnect(self, client: BleakClient):
         """Handle disconnection."""
         _LOGGER.info("Disconnected from button")
+        self._write_char = None
+        self._stop_packet_worker()
         self._session.reset()
         self.connection_state = ConnectionState.DISCONNECTED
         self._running = False
+        self._stop_event.set()
+
+    def _start_packet_worker(self):
+        """Start the task that processes received packets."""
+        self._stop_packet_worker()
+        self._packet_task = asyncio.create_task(self._packet_worker())
+
+    def _stop_packet_worker(self):
+        """Stop the packet worker and drop any unprocessed packets."""
+        if self._packet_task:
+            self._packet_task.cancel()
+            self._packet_task = None
+        while not self._packet_queue.empty():
+            self._packet_queue.get_nowait()
+
+    async def _packet_worker(self):
+        """Process received packets one at a time, in arrival order."""
+        queue = self._packet_queue
+        while True:
+            data = await queue.get()
+            await self._process_packet(data)
 
     async def _send(self, data: bytes):
         """Send data to button."""
         if not self._bleak_client or not self._bleak_client.is_connected:
             raise ConnectionError("Not connected")
 
-        _LOGGER.debug(f"TX ({len(data)} bytes): {data.hex()}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("TX (%d bytes): %s", len(data), data.hex())
 
         # Let Bleak/BLE layer handle MTU negotiation and fragmentation
         await self._bleak_client.write_gatt_char(
-            FLIC2_WRITE_UUID,
+            self._write_char or FLIC2_WRITE_UUID,
             data,
             response=False,
         )
 
     def _on_notification(self, sender, data: bytes):
         """Handle incoming notification."""
-        _LOGGER.debug(f"RX: {data.hex()}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("RX: %s", data.hex())
 
         # Note: BLE fragmentation is handled by the OS/Bleak layer
         # We receive complete notifications even if they exceed MTU
@@ -272,37 +393,66 @@ class Flic2Client:
         self._last_response = data
         self._response_event.set()
 
-        # Process packet asynchronously
-        asyncio.create_task(self._process_packet(data))
+        # After pairing, handle packets inline unless earlier ones are still queued
+        state_machine = self._state_machine
+        if (not state_machine or state_machine.is_complete) and self._packet_queue.empty():
+            self._handle_session_packet(data)
+            return
+
+        # Hand packet to the worker, dropping the oldest one if it falls behind
+        try:
+            self._packet_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self._packet_queue.get_nowait()
+            self._packet_queue.put_nowait(data)
+            _LOGGER.warning("Packet queue full, dropped oldest packet")
 
     async def _process_packet(self, data: bytes):
         """Process received packet."""
-        try:
-            # During pairing, delegate to state machine
-            if self._state_machine and not self._state_machine.is_complete:
+        # During pairing, delegate to state machine
+        if self._state_machine and not self._state_machine.is_complete:
+            try:
                 await self._state_machine.handle_packet(data)
-                return
-
-            # After pairing, handle events
-            packet = self._decoder.decode(data)
+            except Exception:
+                _LOGGER.exception("Error processing packet")
+            return
 
-            if packet.opcode in (Opcode.BUTTON_EVENT_SINGLE, Opcode.BUTTON_EVENT_NOTIFICATION):
-                events = self._decoder.decode_button_event(packet.payload)
-                for event in events:
-                    _LOGGER.debug(f"Button event: {event}")
-                    if self.on_button_event:
-                        self.on_button_event(event)
+        self._handle_session_packet(data)
 
-            elif packet.opcode == Opcode.PING_RESPONSE:
-                _LOGGER.debug("Ping response received")
+    def _handle_session_packet(self, data: bytes):
+        """Handle a packet received after pairing or quick verify."""
+        try:
+            if len(data) < 2:
+                raise ValueError(f"Packet too short: {len(data)} bytes")
 
             # Note: Battery status is included in init_button_events response payload,
             # not as a separate opcode. Could be extracted from there if needed.
-
-        except Exception as e:
-            import traceback
-            _LOGGER.error(f"Error processing packet: {e}")
-            _LOGGER.error(traceback.format_exc())
+            # Signatures are not verified here, so skip building a Packet and
+            # hand the payload after the header and opcode bytes to the handler.
+            handler = self._opcode_handlers.get(data[1])
+            if handler:
+                handler(memoryview(data)[2:])
+
+        except Exception:
+            _LOGGER.exception("Error processing packet")
+
+    def _handle_button_events(self, payload: memoryview):
+        """Dispatch button events from an event notification payload."""
+        for event in self._decoder.decode_button_event(payload):
+            _LOGGER.debug("Button event: %s", event)
+            if self.on_button_event:
+                self.on_button_event(event)
+
+    def _handle_ping_response(self, payload: memoryview):
+        """Handle ping response."""
+        _LOGGER.debug("Ping response received")
+
+    def _set_session_key(self, key: bytes):
+        """Install a new session key for signing and verifying packets."""
+        self._session.session_key = key
+        self._chaskey = ChaskeyLTS(key)
+        self._decoder.set_session_key(key, self._chaskey)
+        self._encoder.set_session_key(key, self._chaskey)
 
     async def _wait_for_response(
         self,
@@ -311,10 +461,8 @@ class Flic2Client:
         """Wait for a response packet."""
         self._response_event.clear()
         try:
-            await asyncio.wait_for(
-                self._response_event.wait(),
-                timeout=timeout,
-            )
+            async with asyncio.timeout(timeout):
+                await self._response_event.wait()
             return self._last_response
         except asyncio.TimeoutError:
             raise TimeoutError("Response timeout")
@@ -363,9 +511,7 @@ class Flic2Client:
             pairing_complete.set()
 
         def on_session_key(key: bytes):
-            self._session.session_key = key
-            self._decoder.set_session_key(key)
-            self._encoder.set_session_key(key)
+            self._set_session_key(key)
 
         self._state_machine.on_pairing_complete = on_complete
         self._state_machine.on_error = on_error
@@ -386,7 +532,7 @@ class Flic2Client:
             raise PairingError(pairing_error)
 
         if result_credentials:
-            self._credentials = result_credentials
+            self.set_credentials(result_credentials)
             self._session.is_paired = True
             self.connection_state = ConnectionState.READY
             _LOGGER.info("Pairing successful!")
@@ -409,6 +555,7 @@ class Flic2Client:
 
         Raises:
             NotPairedError: If no stored credentials
+            NoPairingError: If the button has no pairing for our credentials
             PairingError: If verification fails
         """
         if not self.is_connected:
@@ -439,9 +586,7 @@ class Flic2Client:
             verify_complete.set()
 
         def on_session_key(key: bytes):
-            self._session.session_key = key
-            self._decoder.set_session_key(key)
-            self._encoder.set_session_key(key)
+            self._set_session_key(key)
 
         self._state_machine.on_quick_verify_complete = on_complete
         self._state_machine.on_error = on_error
@@ -459,6 +604,8 @@ class Flic2Client:
 
         if verify_error:
             self.connection_state = ConnectionState.CONNECTED
+            if self._state_machine.ctx.no_pairing_exists:
+                raise NoPairingError(verify_error)
             raise PairingError(verify_error)
 
         # Transfer state from state machine to session
@@ -482,42 +629,19 @@ class Flic2Client:
 
         _LOGGER.info("Initializing button events...")
 
-        # Build InitButtonEventsLight payload
-        event_count = 0
-        boot_id = 0
-        auto_disconnect_time = 511  # Max value (disabled)
-        max_queued_packets = 31
-        max_queued_packets_age = 0xFFFFF
-        enable_hid = 0
-
-        # Pack bit fields
-        bitfield_val = (
-            auto_disconnect_time |
-            (max_queued_packets << 9) |
-            (max_queued_packets_age << 14) |
-            (enable_hid << 34)
-        )
-        bitfield_bytes = bitfield_val.to_bytes(5, 'little')
-
-        payload = (
-            event_count.to_bytes(4, 'little') +
-            boot_id.to_bytes(4, 'little') +
-            bitfield_bytes
-        )
-
-        # Build packet with opcode 0x17 (INIT_BUTTON_EVENTS)
-        packet_body = bytes([0x17]) + payload
+        packet_body = _INIT_BUTTON_EVENTS_BODY
 
-        # Sign packet
-        from ..crypto import ChaskeyLTS
-        chaskey = ChaskeyLTS(self._session.session_key)
-        signature = chaskey.mac_with_dir_and_counter(packet_body, 1, self._session.tx_counter)
+        # Sign packet with the session's Chaskey instance
+        signature = self._chaskey.mac_with_dir_and_counter(packet_body, 1, self._session.tx_counter)
         self._session.tx_counter += 1
 
-        # Build final packet with conn_id header
-        packet = bytes([self._session.conn_id & 0x1F]) + packet_body + signature
+        # Build final packet with conn_id header in a single buffer
+        packet = bytearray((self._session.conn_id & 0x1F,))
+        packet += packet_body
+        packet += signature
 
-        _LOGGER.debug(f"TX init_button_events ({len(packet)} bytes): {packet.hex()}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("TX init_button_events (%d bytes): %s", len(packet), packet.hex())
         await self._send(packet)
 
         # Wait for response
@@ -542,11 +666,15 @@ class Flic2Client:
             # Extract battery level from response payload
             # Response format: header(1) + opcode(1) + payload(13+) + signature(5)
             # Payload: boot_id(4) + event_count(4) + timestamp_hi(4) + battery(1)
-            from ..const import SIGNATURE_LENGTH
             if len(response) > 2 + SIGNATURE_LENGTH:
-                # Strip header, opcode, and signature
-                payload = response[2:-SIGNATURE_LENGTH]
-                _LOGGER.debug("Init response payload (%d bytes): %s", len(payload), payload.hex())
+                # Strip header, opcode, and signature without copying
+                payload = memoryview(response)[2:-SIGNATURE_LENGTH]
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Init response payload (%d bytes): %s",
+                        len(payload),
+                        payload.hex(),
+                    )
                 try:
                     boot_id, event_count, timestamp_hi, battery_level = (
                         self._decoder.decode_init_button_events_response(payload)
@@ -577,15 +705,18 @@ class Flic2Client:
 
         _LOGGER.info("Listening for button events...")
         self._running = True
+        self._stop_event.clear()
 
-        while self._running and self.is_connected:
-            await asyncio.sleep(0.1)
+        # Wait for disconnect or stop() rather than polling
+        if self.is_connected:
+            await self._stop_event.wait()
 
         _LOGGER.info("Stopped listening")
 
     def stop(self):
         """Stop listening for events."""
         self._running = False
+        self._stop_event.set()
 
     async def ping(self) -> bool:
         """
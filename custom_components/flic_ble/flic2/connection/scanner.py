@@ -8,12 +8,20 @@ from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
-from ..const import FLIC2_SERVICE_UUID, DEFAULT_SCAN_TIMEOUT
+from ..const import FLIC2_SERVICE_UUID, FLIC2_SERVICE_UUID_LC, DEFAULT_SCAN_TIMEOUT
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _is_flic2(advertisement_data: AdvertisementData) -> bool:
+    """Check whether an advertisement carries the Flic 2 service UUID."""
+    return any(
+        uuid.lower() == FLIC2_SERVICE_UUID_LC
+        for uuid in (advertisement_data.service_uuids or ())
+    )
+
+
 class Flic2Scanner:
     """Scanner for discovering Flic 2 buttons."""
 
@@ -28,9 +36,7 @@ class Flic2Scanner:
     ):
         """Handle discovered device."""
         # Check if this is a Flic 2 button
-        if FLIC2_SERVICE_UUID.lower() in [
-            uuid.lower() for uuid in (advertisement_data.service_uuids or [])
-        ]:
+        if _is_flic2(advertisement_data):
             if device.address not in self._discovered:
                 _LOGGER.debug(
                     f"Discovered Flic 2: {device.name or 'Unknown'} ({device.address})"
@@ -60,10 +66,15 @@ class Flic2Scanner:
 
         _LOGGER.info(f"Scanning for Flic 2 buttons for {timeout}s...")
 
-        scanner = BleakScanner(
-            detection_callback=self._detection_callback,
-            service_uuids=[FLIC2_SERVICE_UUID],
-        )
+        # Without a per-device callback, filter Bleak's snapshot once at the end
+        # instead of handling every advertisement as it arrives
+        if on_discovered:
+            scanner = BleakScanner(
+                detection_callback=self._detection_callback,
+                service_uuids=[FLIC2_SERVICE_UUID],
+            )
+        else:
+            scanner = BleakScanner(service_uuids=[FLIC2_SERVICE_UUID])
 
         try:
             await scanner.start()
@@ -73,7 +84,16 @@ class Flic2Scanner:
             _LOGGER.error(f"Scan error: {e}")
             raise
 
-        devices = list(self._discovered.values())
+        if on_discovered:
+            devices = list(self._discovered.values())
+        else:
+            devices = [
+                device
+                for device, advertisement_data in (
+                    scanner.discovered_devices_and_advertisement_data.values()
+                )
+                if _is_flic2(advertisement_data)
+            ]
         _LOGGER.info(f"Found {len(devices)} Flic 2 button(s)")
 
         return devices
@@ -5,6 +5,9 @@ FLIC2_SERVICE_UUID = "00420000-8f59-4420-870d-84f3b617e493"
 FLIC2_WRITE_UUID = "00420001-8f59-4420-870d-84f3b617e493"
 FLIC2_NOTIFY_UUID = "00420002-8f59-4420-870d-84f3b617e493"
 
+# Lowercased service UUID for comparing against advertised UUIDs
+FLIC2_SERVICE_UUID_LC = FLIC2_SERVICE_UUID.lower()
+
 # Flic public key for Ed25519 verification (hex)
 FLIC_PUBLIC_KEY_HEX = "d33f2440dd54b31b2e1dcf40132efa41d8f8a7474168df4008f5a95fb3b0d022"
 
@@ -15,6 +18,9 @@ TMP_ID_LENGTH = 4
 PAIRING_ID_LENGTH = 4
 PAIRING_KEY_LENGTH = 16
 
+# Maximum number of received packets waiting to be processed
+MAX_QUEUED_PACKETS = 256
+
 # Header byte format (from flic2lib-c-module):
 # Bits 0-4: conn_id (mask 0x1F)
 # Bit 5: newly_assigned (0x20)
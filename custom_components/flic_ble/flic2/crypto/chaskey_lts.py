@@ -15,17 +15,8 @@ Standard Chaskey: https://mouha.be/chaskey/
 import struct
 from typing import List
 
-
-def _rotl32(x: int, n: int) -> int:
-    """32-bit left rotation."""
-    x &= 0xFFFFFFFF
-    return ((x << n) | (x >> (32 - n))) & 0xFFFFFFFF
-
-
-def _rotr32(x: int, n: int) -> int:
-    """32-bit right rotation."""
-    x &= 0xFFFFFFFF
-    return ((x >> n) | (x << (32 - n))) & 0xFFFFFFFF
+# Four little-endian 32-bit words (one 128-bit block)
+_BLOCK = struct.Struct("<4I")
 
 
 def _times_two(key: List[int]) -> List[int]:
@@ -55,6 +46,8 @@ def _times_two(key: List[int]) -> List[int]:
 class ChaskeyLTS:
     """Chaskey-LTS 16-round MAC."""
 
+    __slots__ = ("k", "k1", "k2")
+
     ROUNDS = 16
 
     def __init__(self, key: bytes):
@@ -68,7 +61,7 @@ class ChaskeyLTS:
             raise ValueError(f"Key must be 16 bytes, got {len(key)}")
 
         # Parse key as 4 little-endian 32-bit words
-        self.k = list(struct.unpack("<4I", key))
+        self.k = list(_BLOCK.unpack(key))
 
         # Generate subkeys
         self.k1 = _times_two(self.k)
@@ -92,22 +85,26 @@ class ChaskeyLTS:
             r6 = ROR32(r6, 16);  // post-rotate
         """
         r4, r5, r6, r7 = v[0], v[1], v[2], v[3]
+        m = 0xFFFFFFFF
+
+        # Rotations are written inline as (x >> n) | ((x << (32 - n)) & m);
+        # all words stay within 32 bits, so no input masking is needed.
 
         # Pre-rotate r6
-        r6 = _rotr32(r6, 16)
+        r6 = (r6 >> 16) | ((r6 << 16) & m)
 
         for _ in range(self.ROUNDS):
-            r4 = (r4 + r5) & 0xFFFFFFFF
-            r5 = r4 ^ _rotr32(r5, 27)
-            r6 = (r7 + _rotr32(r6, 16)) & 0xFFFFFFFF
-            r7 = r6 ^ _rotr32(r7, 24)
-            r6 = (r6 + r5) & 0xFFFFFFFF
-            r4 = (r7 + _rotr32(r4, 16)) & 0xFFFFFFFF
-            r5 = r6 ^ _rotr32(r5, 25)
-            r7 = r4 ^ _rotr32(r7, 19)
+            r4 = (r4 + r5) & m
+            r5 = r4 ^ ((r5 >> 27) | ((r5 << 5) & m))
+            r6 = (r7 + ((r6 >> 16) | ((r6 << 16) & m))) & m
+            r7 = r6 ^ ((r7 >> 24) | ((r7 << 8) & m))
+            r6 = (r6 + r5) & m
+            r4 = (r7 + ((r4 >> 16) | ((r4 << 16) & m))) & m
+            r5 = r6 ^ ((r5 >> 25) | ((r5 << 7) & m))
+            r7 = r4 ^ ((r7 >> 19) | ((r7 << 13) & m))
 
         # Post-rotate r6
-        r6 = _rotr32(r6, 16)
+        r6 = (r6 >> 16) | ((r6 << 16) & m)
 
         return [r4, r5, r6, r7]
 
@@ -128,7 +125,7 @@ class ChaskeyLTS:
         block_size = 16
         i = 0
         while i + block_size <= len(message):
-            block = struct.unpack("<4I", message[i:i + block_size])
+            block = _BLOCK.unpack_from(message, i)
             v[0] ^= block[0]
             v[1] ^= block[1]
             v[2] ^= block[2]
@@ -151,7 +148,7 @@ class ChaskeyLTS:
             subkey = self.k1
 
         # XOR with subkey and process
-        block = list(struct.unpack("<4I", bytes(last_block)))
+        block = _BLOCK.unpack(last_block)
         v[0] ^= block[0] ^ subkey[0]
         v[1] ^= block[1] ^ subkey[1]
         v[2] ^= block[2] ^ subkey[2]
@@ -164,7 +161,7 @@ class ChaskeyLTS:
         v[2] ^= self.k[2]
         v[3] ^= self.k[3]
 
-        return struct.pack("<4I", v[0], v[1], v[2], v[3])
+        return _BLOCK.pack(v[0], v[1], v[2], v[3])
 
     def mac5(self, message: bytes) -> bytes:
         """
@@ -212,7 +209,7 @@ class ChaskeyLTS:
         block_size = 16
         i = 0
         while i + block_size < len(message):  # Note: strict < for this variant
-            block = struct.unpack("<4I", message[i:i + block_size])
+            block = _BLOCK.unpack_from(message, i)
             v[0] ^= block[0]
             v[1] ^= block[1]
             v[2] ^= block[2]
@@ -235,7 +232,7 @@ class ChaskeyLTS:
             subkey = self.k1
 
         # XOR last block and subkey
-        block = list(struct.unpack("<4I", bytes(last_block)))
+        block = _BLOCK.unpack(last_block)
         v[0] ^= block[0]
         v[1] ^= block[1]
         v[2] ^= block[2]
@@ -275,7 +272,7 @@ class ChaskeyLTS:
             raise ValueError(f"Block must be 16 bytes, got {len(plaintext)}")
 
         # XOR with key and k1
-        block = list(struct.unpack("<4I", plaintext))
+        block = _BLOCK.unpack(plaintext)
         v = [
             block[0] ^ self.k[0] ^ self.k1[0],
             block[1] ^ self.k[1] ^ self.k1[1],
@@ -292,4 +289,4 @@ class ChaskeyLTS:
         v[2] ^= self.k1[2]
         v[3] ^= self.k1[3]
 
-        return struct.pack("<4I", v[0], v[1], v[2], v[3])
+        return _BLOCK.pack(v[0], v[1], v[2], v[3])
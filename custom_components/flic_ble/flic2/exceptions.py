@@ -17,6 +17,10 @@ class InvalidVerifierError(PairingError):
     """Button rejected our verifier."""
 
 
+class NoPairingError(PairingError):
+    """Button has no pairing for our stored pairing ID."""
+
+
 class InvalidSignatureError(Flic2Error):
     """Invalid Ed25519 or Chaskey signature."""
 
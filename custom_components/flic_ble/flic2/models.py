@@ -43,7 +43,7 @@ class ConnectionState(IntEnum):
     READY = 6
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonEvent:
     """Represents a button event."""
     event_type: ButtonEventType
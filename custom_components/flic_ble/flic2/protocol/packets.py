@@ -1,16 +1,40 @@
 """Packet encoding and decoding for Flic 2 protocol."""
 
 import struct
+import time
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 
 from .opcodes import Opcode
 from ..const import SIGNATURE_LENGTH, CONN_ID_MASK, NEWLY_ASSIGNED_BIT, MULTI_BIT, FRAGMENT_BIT
 from ..crypto import ChaskeyLTS
 from ..models import ButtonEventType, ButtonEvent
 
+# Button event notification layout: press_counter(4), then 7-byte records of
+# timestamp_lo(4) + timestamp_hi(2) + event_info(1)
+_PRESS_COUNTER = struct.Struct("<I")
+_EVENT_RECORD = struct.Struct("<IHB")
 
-@dataclass
+# Simple (3-bit) event encodings indexed by value; unused values decode as UP
+_SIMPLE_EVENT_TYPES = (
+    ButtonEventType.UP,
+    ButtonEventType.DOWN,
+    ButtonEventType.CLICK,
+    ButtonEventType.SINGLE_CLICK,
+    ButtonEventType.DOUBLE_CLICK,
+    ButtonEventType.HOLD,
+    ButtonEventType.UP,
+    ButtonEventType.UP,
+)
+
+# FullVerifyResponse2 firmware version
+_FIRMWARE_VERSION = struct.Struct("<I")
+
+# InitButtonEventsResponse: boot_id(4) + event_count(4) + timestamp_hi(4) + battery(1)
+_INIT_BUTTON_EVENTS_RESPONSE = struct.Struct("<IIIB")
+
+
+@dataclass(slots=True)
 class Packet:
     """Decoded packet."""
     conn_id: int
@@ -38,16 +62,28 @@ class Packet:
 class PacketEncoder:
     """Encodes packets for transmission."""
 
+    __slots__ = ("session_key", "_chaskey", "_ping_cache")
+
     def __init__(self, session_key: Optional[bytes] = None):
         self.session_key = session_key
         self._chaskey: Optional[ChaskeyLTS] = None
         if session_key:
             self._chaskey = ChaskeyLTS(session_key)
 
-    def set_session_key(self, key: bytes):
-        """Set session key for signing packets."""
+        # Signed ping packets by conn_id, valid for the current session key
+        self._ping_cache: Dict[int, bytes] = {}
+
+    def set_session_key(self, key: bytes, chaskey: Optional[ChaskeyLTS] = None):
+        """
+        Set session key for signing packets.
+
+        Args:
+            key: 16-byte session key
+            chaskey: Optional ChaskeyLTS already built from key, to share it
+        """
         self.session_key = key
-        self._chaskey = ChaskeyLTS(key)
+        self._chaskey = chaskey or ChaskeyLTS(key)
+        self._ping_cache.clear()
 
     def encode(
         self,
@@ -75,15 +111,15 @@ class PacketEncoder:
         if newly_assigned:
             header |= NEWLY_ASSIGNED_BIT
 
-        # Build packet
-        packet = bytes([header, opcode]) + payload
+        # Build packet in a single buffer
+        packet = bytearray((header, opcode))
+        packet += payload
 
         # Add signature if requested
         if sign and self._chaskey:
-            signature = self._chaskey.mac5(packet)
-            packet = packet + signature
+            packet += self._chaskey.mac5(packet)
 
-        return packet
+        return bytes(packet)
 
     def encode_full_verify_request_1(self, tmp_id: bytes) -> bytes:
         """Encode FullVerifyRequest1."""
@@ -171,12 +207,20 @@ class PacketEncoder:
 
     def encode_ping(self, conn_id: int = 0) -> bytes:
         """Encode ping request."""
-        return self.encode(Opcode.PING_REQUEST, b"", conn_id=conn_id, sign=True)
+        # The signed ping only depends on the session key and conn_id
+        packet = self._ping_cache.get(conn_id)
+        if packet is None:
+            packet = self.encode(Opcode.PING_REQUEST, b"", conn_id=conn_id, sign=True)
+            if self._chaskey:
+                self._ping_cache[conn_id] = packet
+        return packet
 
 
 class PacketDecoder:
     """Decodes received packets."""
 
+    __slots__ = ("session_key", "_chaskey", "_fragment_buffer")
+
     def __init__(self, session_key: Optional[bytes] = None):
         self.session_key = session_key
         self._chaskey: Optional[ChaskeyLTS] = None
@@ -186,10 +230,16 @@ class PacketDecoder:
         # Fragmentation reassembly
         self._fragment_buffer: bytes = b""
 
-    def set_session_key(self, key: bytes):
-        """Set session key for verifying signatures."""
+    def set_session_key(self, key: bytes, chaskey: Optional[ChaskeyLTS] = None):
+        """
+        Set session key for verifying signatures.
+
+        Args:
+            key: 16-byte session key
+            chaskey: Optional ChaskeyLTS already built from key, to share it
+        """
         self.session_key = key
-        self._chaskey = ChaskeyLTS(key)
+        self._chaskey = chaskey or ChaskeyLTS(key)
 
     def decode(self, data: bytes, verify_signature: bool = False) -> Packet:
         """
@@ -337,7 +387,7 @@ class PacketDecoder:
         # Firmware version (4 bytes, little-endian)
         firmware_version = 0
         if offset + 4 <= len(payload):
-            firmware_version = struct.unpack("<I", payload[offset:offset + 4])[0]
+            firmware_version = _FIRMWARE_VERSION.unpack_from(payload, offset)[0]
             offset += 4
 
         # Battery level (1 byte)
@@ -381,7 +431,7 @@ class PacketDecoder:
             raise ValueError(f"QuickVerifyResponse too short: {len(payload)} bytes")
         return payload[0:8]
 
-    def decode_button_event(self, payload: bytes) -> List[ButtonEvent]:
+    def decode_button_event(self, payload: bytes) -> Iterator[ButtonEvent]:
         """
         Decode button event notification payload.
 
@@ -391,28 +441,29 @@ class PacketDecoder:
           - timestamp: 6 bytes (32768 Hz ticks)
           - event_info: 1 byte (event_encoded + flags)
 
-        Returns:
-            List of ButtonEvent objects
+        Yields:
+            ButtonEvent objects, in the order they appear in the payload
         """
         import logging
         _LOGGER = logging.getLogger(__name__)
 
-        events = []
-
         if len(payload) < 4:
-            return events
+            return
 
-        press_counter = int.from_bytes(payload[0:4], 'little')
+        press_counter = _PRESS_COUNTER.unpack_from(payload)[0]
 
-        # Each event is 7 bytes: timestamp(6) + event_info(1)
-        offset = 4
-        while offset + 7 <= len(payload):
-            timestamp = int.from_bytes(payload[offset:offset + 6], 'little')
-            event_info = payload[offset + 6]
-            offset += 7
+        # All events in one notification share the same receive time
+        received_at = time.time()
+
+        # Each event is 7 bytes: timestamp(6) + event_info(1); a trailing
+        # partial record is ignored
+        end = 4 + (len(payload) - 4) // _EVENT_RECORD.size * _EVENT_RECORD.size
+        records = _EVENT_RECORD.iter_unpack(memoryview(payload)[4:end])
+        for timestamp_lo, timestamp_hi, event_info in records:
+            timestamp = timestamp_lo | (timestamp_hi << 32)
 
             event_encoded = event_info & 0x0F
-            was_queued = bool((event_info >> 4) & 0x01)
+            was_queued = (event_info & 0x10) != 0
 
             # Decode event type based on encoding (per official protocol)
             # If bit 3 is set, it's a button up with additional info
@@ -429,15 +480,7 @@ class PacketDecoder:
                     event_type = ButtonEventType.UP
             else:
                 # Simple event types
-                event_map = {
-                    0: ButtonEventType.UP,
-                    1: ButtonEventType.DOWN,
-                    2: ButtonEventType.CLICK,
-                    3: ButtonEventType.SINGLE_CLICK,
-                    4: ButtonEventType.DOUBLE_CLICK,
-                    5: ButtonEventType.HOLD,
-                }
-                event_type = event_map.get(event_encoded, ButtonEventType.UP)
+                event_type = _SIMPLE_EVENT_TYPES[event_encoded]
 
             # Calculate age from timestamp (32768 Hz clock)
             age_seconds = 0.0  # Would need init_timestamp to calculate properly
@@ -447,14 +490,13 @@ class PacketDecoder:
                 event_type.name, was_queued, press_counter, event_info
             )
 
-            events.append(ButtonEvent(
+            yield ButtonEvent(
                 event_type=event_type,
                 was_queued=was_queued,
                 age_seconds=age_seconds,
                 press_counter=press_counter,
-            ))
-
-        return events
+                timestamp=received_at,
+            )
 
     def decode_init_button_events_response(self, payload: bytes) -> Tuple[int, int, int, int]:
         """
@@ -472,17 +514,16 @@ class PacketDecoder:
         import logging
         _LOGGER = logging.getLogger(__name__)
 
-        if len(payload) < 13:
+        if len(payload) < _INIT_BUTTON_EVENTS_RESPONSE.size:
             _LOGGER.warning(
                 "InitButtonEventsResponse payload too short: %d bytes, expected at least 13. Payload: %s",
                 len(payload), payload.hex()
             )
             return 0, 0, 0, 0
 
-        boot_id = int.from_bytes(payload[0:4], 'little')
-        event_count = int.from_bytes(payload[4:8], 'little')
-        timestamp_hi = int.from_bytes(payload[8:12], 'little')
-        battery_level = payload[12]
+        boot_id, event_count, timestamp_hi, battery_level = (
+            _INIT_BUTTON_EVENTS_RESPONSE.unpack_from(payload)
+        )
 
         _LOGGER.debug(
             "InitButtonEventsResponse: boot_id=%d, event_count=%d, timestamp_hi=%d, battery=%d%%",
@@ -3,11 +3,12 @@
 import logging
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Optional, Callable, Awaitable, List
+from typing import Optional, Callable, Awaitable, Dict, List
 
 from .opcodes import Opcode, FullVerifyFailReason, QuickVerifyFailReason
 from .packets import PacketEncoder, PacketDecoder, Packet
 from ..crypto import (
+    ChaskeyLTS,
     generate_keypair,
     compute_shared_secret,
     derive_full_verify_secret,
@@ -84,6 +85,7 @@ class PairingContext:
 
     # Error info
     error_reason: Optional[int] = None
+    no_pairing_exists: bool = False
 
 
 class PairingStateMachine:
@@ -114,6 +116,13 @@ class PairingStateMachine:
         self.encoder = PacketEncoder()
         self.decoder = PacketDecoder()
 
+        # Response handlers for the states that are waiting on the button
+        self._state_handlers: Dict[PairingState, Callable[[Packet], Awaitable[bool]]] = {
+            PairingState.FULL_VERIFY_REQUEST_1_SENT: self._handle_full_verify_response_1,
+            PairingState.FULL_VERIFY_REQUEST_2_SENT: self._handle_full_verify_response_2,
+            PairingState.QUICK_VERIFY_REQUEST_SENT: self._handle_quick_verify_response,
+        }
+
         # Callbacks
         self.on_session_key: Optional[Callable[[bytes], None]] = None
         self.on_pairing_complete: Optional[Callable[[PairingCredentials, ButtonInfo], None]] = None
@@ -155,6 +164,12 @@ class PairingStateMachine:
         self.state = PairingState.QUICK_VERIFY_REQUEST_SENT
         _LOGGER.debug(f"Sent QuickVerifyRequest with pairing_id={self.stored_credentials.pairing_id.hex()}")
 
+    def _set_session_key(self, key: bytes):
+        """Install the session key on the encoder and decoder."""
+        chaskey = ChaskeyLTS(key)
+        self.decoder.set_session_key(key, chaskey)
+        self.encoder.set_session_key(key, chaskey)
+
     async def handle_packet(self, data: bytes) -> bool:
         """
         Handle incoming packet.
@@ -168,16 +183,10 @@ class PairingStateMachine:
         packet = self.decoder.decode(data)
         _LOGGER.debug(f"Received packet: opcode={packet.opcode:#x}, state={self.state}")
 
-        if self.state == PairingState.FULL_VERIFY_REQUEST_1_SENT:
-            return await self._handle_full_verify_response_1(packet)
-
-        elif self.state == PairingState.FULL_VERIFY_REQUEST_2_SENT:
-            return await self._handle_full_verify_response_2(packet)
-
-        elif self.state == PairingState.QUICK_VERIFY_REQUEST_SENT:
-            return await self._handle_quick_verify_response(packet)
-
-        return False
+        handler = self._state_handlers.get(self.state)
+        if handler is None:
+            return False
+        return await handler(packet)
 
     async def _handle_full_verify_response_1(self, packet: Packet) -> bool:
         """Handle FullVerifyResponse1."""
@@ -284,8 +293,7 @@ class PairingStateMachine:
         _LOGGER.debug("Sent FullVerifyRequest2")
 
         # Set session key for future packet verification
-        self.decoder.set_session_key(self.ctx.session_key)
-        self.encoder.set_session_key(self.ctx.session_key)
+        self._set_session_key(self.ctx.session_key)
 
         if self.on_session_key:
             self.on_session_key(self.ctx.session_key)
@@ -361,6 +369,7 @@ class PairingStateMachine:
         if packet.opcode == Opcode.NO_PAIRING_EXISTS:
             self.state = PairingState.FAILED
             self.ctx.error_reason = QuickVerifyFailReason.INVALID_PAIRING_ID
+            self.ctx.no_pairing_exists = True
             error_msg = "QuickVerify failed: No pairing exists on button (needs re-pairing)"
             _LOGGER.error(error_msg)
             if self.on_error:
@@ -397,8 +406,7 @@ class PairingStateMachine:
         _LOGGER.debug(f"QuickVerify session key: {self.ctx.session_key.hex()}")
 
         # Set session key
-        self.decoder.set_session_key(self.ctx.session_key)
-        self.encoder.set_session_key(self.ctx.session_key)
+        self._set_session_key(self.ctx.session_key)
 
         if self.on_session_key:
             self.on_session_key(self.ctx.session_key)
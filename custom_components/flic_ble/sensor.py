@@ -13,7 +13,6 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import SIGNAL_BATTERY_UPDATE
 from .coordinator import Flic2Coordinator, FlicConfigEntry
 from .entity import Flic2Entity
 
@@ -46,11 +45,6 @@ class Flic2BatterySensor(Flic2Entity, SensorEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.button_uuid}_battery"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the battery level."""
-        return self.coordinator.battery_level
-
     async def async_added_to_hass(self) -> None:
         """Subscribe to battery updates when entity is added."""
         await super().async_added_to_hass()
@@ -59,12 +53,15 @@ class Flic2BatterySensor(Flic2Entity, SensorEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{SIGNAL_BATTERY_UPDATE}_{self.coordinator.address}",
+                self.coordinator.signal_battery_update,
                 self._handle_battery_update,
             )
         )
+        # Pick up a level reported before we subscribed
+        self._attr_native_value = self.coordinator.battery_level
 
     @callback
     def _handle_battery_update(self, level: int) -> None:
         """Handle battery level update."""
+        self._attr_native_value = level
         self.async_write_ha_state()